@@ -0,0 +1,54 @@
+"""
+Measures the import time of the package and the cost of
+constructing small `Row` and `Matrix` objects.
+
+Run from the repository root:
+    python benchmarks/bench_construction.py
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import timeit
+
+SRC = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+sys.path.insert(0, SRC)
+
+from matrixops import Matrix, Row  # noqa: E402
+
+
+def import_time(runs: int = 20) -> float:
+    """Returns the best wall time (in ms) of importing matrixops in a fresh interpreter."""
+
+    code = (
+        "import time; start = time.perf_counter(); import matrixops; "
+        "print((time.perf_counter() - start) * 1000)"
+    )
+    env = dict(os.environ, PYTHONPATH=SRC)
+
+    timings: list[float] = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+        ).stdout
+        timings.append(float(output))
+
+    return min(timings)
+
+
+def per_call_time(statement: str, setup: str = "pass", number: int = 100_000) -> float:
+    """Returns the best time (in µs) per execution of `statement`."""
+
+    timer = timeit.Timer(statement, setup, globals={"Matrix": Matrix, "Row": Row})
+    return min(timer.repeat(repeat=5, number=number)) / number * 1e6
+
+
+if __name__ == "__main__":
+    print(f"import matrixops:      {import_time():8.2f} ms")
+    print(f"Row(1, 2, 3):          {per_call_time('Row(1, 2, 3)'):8.2f} µs")
+    print(f"Matrix 2x2:            {per_call_time('Matrix(Row(1, 2), Row(3, 4))'):8.2f} µs")
+    print(f"Matrix 3x3:            {per_call_time('Matrix(Row(1, 2, 3), Row(4, 5, 6), Row(7, 8, 9))'):8.2f} µs")
+    # attribute access used to go through an overridden __getattribute__
+    print(f"Matrix.rows access:    {per_call_time('m.rows', 'm = Matrix(Row(1, 2), Row(3, 4))'):8.2f} µs")
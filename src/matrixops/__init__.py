@@ -1,2 +1,17 @@
+from __future__ import annotations
+
+from typing import Any
+
 from matrixops.row import Row
-from matrixops.matrix import Matrix
\ No newline at end of file
+from matrixops.matrix import Matrix
+from matrixops.numeric import NumericMode, NumericPolicy
+
+
+def __getattr__(name: str) -> Any:
+    # LazyMatrix is imported on first use, to keep `import matrixops` light
+    if name == "LazyMatrix":
+        from matrixops.lazy import LazyMatrix
+
+        return LazyMatrix
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
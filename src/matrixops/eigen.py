@@ -0,0 +1,370 @@
+from __future__ import annotations
+
+import cmath
+import math
+from collections.abc import MutableSequence, Sequence
+
+from matrixops.exceptions import NoConvergence
+from matrixops.row import Row
+
+
+Grid = MutableSequence[MutableSequence[complex]]
+EigenPair = tuple[complex, list[complex]]
+
+# vectors iterated on by dominant_eigenpairs on top of the requested k
+_EXTRA_VECTORS = 2
+
+
+def hessenberg(rows: Sequence[Sequence[int | float]]) -> MutableSequence[MutableSequence[float]]:
+    """
+    Reduces a square matrix to upper Hessenberg form with Householder
+    reflections. The result is similar to the input, so it has
+    the same eigenvalues.
+    """
+
+    h: MutableSequence[MutableSequence[float]] = [[float(num) for num in row] for row in rows]
+    n = len(h)
+
+    for k in range(n - 2):
+        x = [h[i][k] for i in range(k + 1, n)]
+        norm = math.sqrt(sum(num * num for num in x))
+        if norm == 0:
+            continue
+
+        # reflect x onto -sign(x0) * |x| * e1, avoiding cancellation
+        v = x[:]
+        v[0] += math.copysign(norm, x[0])
+        v_norm2 = sum(num * num for num in v)
+
+        # H = (I - 2vvᵀ/vᵀv) H (I - 2vvᵀ/vᵀv), touching rows and columns k+1..n-1
+        for j in range(n):
+            s = 2 * sum(v[i] * h[k + 1 + i][j] for i in range(len(v))) / v_norm2
+            for i in range(len(v)):
+                h[k + 1 + i][j] -= s * v[i]
+
+        for i in range(n):
+            s = 2 * sum(h[i][k + 1 + j] * v[j] for j in range(len(v))) / v_norm2
+            for j in range(len(v)):
+                h[i][k + 1 + j] -= s * v[j]
+
+        for i in range(k + 2, n):
+            h[i][k] = 0.0
+
+    return h
+
+
+def qr_eigenvalues(
+    rows: Sequence[Sequence[int | float]],
+    tolerance: float = 1e-12,
+    max_iterations: int = 10_000,
+) -> list[complex]:
+    """
+    Computes all eigenvalues with Wilkinson-shifted QR iterations
+    on the Hessenberg form of the matrix, deflating the active block
+    whenever a subdiagonal element becomes negligible.
+    """
+
+    h: Grid = [[complex(num) for num in row] for row in hessenberg(rows)]
+    eigenvalues: list[complex] = []
+
+    hi = len(h) - 1
+    iterations = 0
+    since_deflation = 0
+
+    while hi >= 0:
+        # find the start of the unreduced block ending at hi
+        lo = hi
+        while lo > 0 and abs(h[lo][lo - 1]) > tolerance * (abs(h[lo - 1][lo - 1]) + abs(h[lo][lo]) or 1):
+            lo -= 1
+
+        if lo == hi:
+            eigenvalues.append(h[hi][hi])
+            hi -= 1
+            since_deflation = 0
+            continue
+
+        if iterations >= max_iterations:
+            raise NoConvergence("QR iterations did not converge.")
+
+        a, b = h[hi - 1][hi - 1], h[hi - 1][hi]
+        c, d = h[hi][hi - 1], h[hi][hi]
+
+        if since_deflation and since_deflation % 10 == 0:
+            # exceptional shift, breaks cycles of the Wilkinson shift
+            shift = d + abs(c)
+        else:
+            # eigenvalue of the trailing 2x2 block closest to d
+            half_trace = (a + d) / 2
+            disc = cmath.sqrt(half_trace * half_trace - (a * d - b * c))
+            shift = min(half_trace + disc, half_trace - disc, key=lambda mu: abs(mu - d))
+
+        _qr_step(h, lo, hi, shift)
+        iterations += 1
+        since_deflation += 1
+
+    return eigenvalues
+
+
+def _qr_step(h: Grid, lo: int, hi: int, shift: complex) -> None:
+    # H - μI = QR, H <- RQ + μI, using Givens rotations on the block lo..hi
+    for i in range(lo, hi + 1):
+        h[i][i] -= shift
+
+    rotations: list[tuple[complex, complex]] = []
+
+    for k in range(lo, hi):
+        x, y = h[k][k], h[k + 1][k]
+        r = math.hypot(abs(x), abs(y))
+        c, s = (x / r, y / r) if r != 0 else (1 + 0j, 0j)
+
+        for j in range(k, hi + 1):
+            t1, t2 = h[k][j], h[k + 1][j]
+            h[k][j] = c.conjugate() * t1 + s.conjugate() * t2
+            h[k + 1][j] = -s * t1 + c * t2
+
+        rotations.append((c, s))
+
+    for k, (c, s) in enumerate(rotations, start=lo):
+        for i in range(lo, k + 2):
+            t1, t2 = h[i][k], h[i][k + 1]
+            h[i][k] = t1 * c + t2 * s
+            h[i][k + 1] = -t1 * s.conjugate() + t2 * c.conjugate()
+
+    for i in range(lo, hi + 1):
+        h[i][i] += shift
+
+
+def inverse_iteration(
+    rows: Sequence[Sequence[int | float | complex]],
+    eigenvalue: complex,
+    iterations: int = 3,
+    against: Sequence[Sequence[complex]] = (),
+) -> list[complex]:
+    """
+    Computes the unit eigenvector belonging to an (approximate)
+    eigenvalue by repeatedly solving (A - λI)x = b.
+
+    The vector is kept orthogonal to the vectors in `against`, which
+    are the eigenvectors already found for the same eigenvalue.
+    """
+
+    n = len(rows)
+    shifted: Grid = [
+        [complex(num) - (eigenvalue if i == j else 0) for j, num in enumerate(row)]
+        for i, row in enumerate(rows)
+    ]
+    scale = max((abs(num) for row in shifted for num in row), default=0) or 1
+    lu, pivots = _lu(shifted, tiny=scale * 1e-14)
+
+    # a start vector that is unlikely to be orthogonal to the eigenvector,
+    # or the unit vector that keeps most of its length once the vectors
+    # in `against` are projected out of it
+    candidates: list[list[complex]] = [[complex(1 + i / n) for i in range(n)]]
+    if against:
+        candidates += [[complex(i == j) for i in range(n)] for j in range(n)]
+
+    vector = max(
+        (_orthogonalized(candidate, against) for candidate in candidates),
+        key=lambda v: math.sqrt(sum(abs(num) ** 2 for num in v)),
+    )
+
+    for _ in range(iterations):
+        vector = _normalized(_orthogonalized(_lu_solve(lu, pivots, vector), against))
+
+    return vector
+
+
+def _orthogonalized(vector: Sequence[complex], against: Sequence[Sequence[complex]]) -> list[complex]:
+    # assumes the vectors in `against` are orthonormal
+    v = list(vector)
+    for q in against:
+        projection = sum(a.conjugate() * b for a, b in zip(q, v))
+        v = [b - projection * a for a, b in zip(q, v)]
+
+    return v
+
+
+def _residual(rows: Sequence[Sequence[int | float]], eigenvalue: complex, vector: Sequence[complex]) -> float:
+    # max |(A - λI)x|
+    return max(
+        abs(sum(num * x for num, x in zip(row, vector)) - eigenvalue * vector[i])
+        for i, row in enumerate(rows)
+    )
+
+
+def _lu(m: Grid, tiny: float) -> tuple[Grid, list[int]]:
+    # LU decomposition with partial pivoting, in place; exactly
+    # singular pivots are replaced by `tiny` so that the solve
+    # blows up along the null space, which is what we want here
+    n = len(m)
+    pivots = list(range(n))
+
+    for k in range(n):
+        p = max(range(k, n), key=lambda i: abs(m[i][k]))
+        if p != k:
+            m[k], m[p] = m[p], m[k]
+            pivots[k], pivots[p] = pivots[p], pivots[k]
+
+        if abs(m[k][k]) < tiny:
+            m[k][k] = complex(tiny)
+
+        for i in range(k + 1, n):
+            factor = m[i][k] / m[k][k]
+            m[i][k] = factor
+            for j in range(k + 1, n):
+                m[i][j] -= factor * m[k][j]
+
+    return m, pivots
+
+
+def _lu_solve(lu: Grid, pivots: list[int], b: Sequence[complex]) -> list[complex]:
+    n = len(lu)
+    x = [b[pivots[i]] for i in range(n)]
+
+    for i in range(n):
+        x[i] -= sum(lu[i][j] * x[j] for j in range(i))
+
+    for i in reversed(range(n)):
+        x[i] = (x[i] - sum(lu[i][j] * x[j] for j in range(i + 1, n))) / lu[i][i]
+
+    return x
+
+
+def _normalized(vector: Sequence[complex]) -> list[complex]:
+    norm = math.sqrt(sum(abs(num) ** 2 for num in vector))
+    if norm == 0:
+        return list(vector)
+
+    # fix the phase so that the largest component is real and positive
+    largest = max(vector, key=abs)
+    phase = abs(largest) / largest
+
+    return [num * phase / norm for num in vector]
+
+
+def eigenpairs(
+    rows: Sequence[Sequence[int | float]],
+    tolerance: float = 1e-12,
+    max_iterations: int = 10_000,
+) -> list[EigenPair]:
+    eigenvalues = qr_eigenvalues(rows, tolerance, max_iterations)
+
+    # eigenvalues closer than this are treated as one repeated eigenvalue
+    closeness = math.sqrt(tolerance)
+    scale = max((abs(num) for row in rows for num in row), default=0) or 1
+
+    pairs: list[EigenPair] = []
+
+    for value in eigenvalues:
+        found = [
+            vector for other, vector in pairs
+            if abs(other - value) <= closeness * max(1, abs(value))
+        ]
+        vector = inverse_iteration(rows, value, against=found)
+
+        if found and _residual(rows, value, vector) > closeness * scale:
+            # a defective eigenvalue has fewer independent
+            # eigenvectors than its multiplicity
+            vector = inverse_iteration(rows, value)
+
+        pairs.append((value, vector))
+
+    return pairs
+
+
+def dominant_eigenpairs(
+    rows: Sequence[Row],
+    k: int = 1,
+    tolerance: float = 1e-10,
+    max_iterations: int = 1000,
+) -> list[EigenPair]:
+    """
+    Computes the `k` eigenpairs of largest magnitude with orthogonal
+    (block power) iteration on `k` plus a few extra vectors, returning
+    the top `k` Ritz pairs once their residuals are within `tolerance`.
+
+    The extra vectors let the iteration converge when the k-th and
+    (k+1)-th eigenvalues have the same magnitude, e.g. a complex
+    conjugate pair or a pair like 3 and -3. If it still has not
+    converged after `max_iterations`, the full QR engine is used.
+
+    Only matrix-vector products with the rows are needed, so this is
+    much cheaper than the full QR engine when `k` is small.
+    """
+
+    n = len(rows)
+    if not 1 <= k <= n:
+        raise ValueError(f"k must be between 1 and {n}.")
+
+    size = min(n, k + _EXTRA_VECTORS)
+    norm = math.sqrt(sum(num * num for row in rows for num in row)) or 1
+
+    # deterministic, linearly independent start vectors
+    basis = _orthonormalized([
+        [1 / (1 + abs(i - j)) for i in range(n)]
+        for j in range(size)
+    ])
+
+    for _ in range(max_iterations):
+        images = [[row.mul_by_col(vector) for row in rows] for vector in basis]
+        # projection of the matrix onto the current subspace: H = QᵀAQ
+        projected = [[_dot(basis[i], images[j]) for j in range(size)] for i in range(size)]
+
+        # Ritz pairs: eigenpairs of H lifted back through the basis,
+        # Ay is lifted through the images, as A(Qy) = (AQ)y
+        ritz_pairs = sorted(eigenpairs(projected), key=lambda pair: abs(pair[0]), reverse=True)[:k]
+
+        pairs: list[EigenPair] = []
+        residual = 0.0
+
+        for value, small_vector in ritz_pairs:
+            vector = [sum(basis[i][r] * small_vector[i] for i in range(size)) for r in range(n)]
+            image = [sum(images[i][r] * small_vector[i] for i in range(size)) for r in range(n)]
+
+            residual = max(residual, math.sqrt(sum(abs(a - value * x) ** 2 for a, x in zip(image, vector))))
+            pairs.append((value, _normalized(vector)))
+
+        if residual <= tolerance * norm:
+            return pairs
+
+        basis = _orthonormalized(images)
+
+    # the iteration stalled, e.g. more eigenvalues of equal
+    # magnitude than there are extra vectors
+    pairs = eigenpairs([row.nums for row in rows], min(tolerance, 1e-12))
+    return sorted(pairs, key=lambda pair: abs(pair[0]), reverse=True)[:k]
+
+
+def _dot(v1: Sequence[float], v2: Sequence[float]) -> float:
+    return sum(a * b for a, b in zip(v1, v2))
+
+
+def _orthonormalized(vectors: Sequence[Sequence[float]]) -> list[list[float]]:
+    # modified Gram-Schmidt
+    basis: list[list[float]] = []
+
+    for vector in vectors:
+        v = _orthogonalized_real(vector, basis)
+
+        norm = math.sqrt(_dot(v, v))
+        if norm <= 1e-12 * (math.sqrt(_dot(vector, vector)) or 1):
+            # the vector collapsed into the span of the basis, replace it
+            # with the unit vector that is furthest from that span
+            v = max(
+                (_orthogonalized_real([float(i == j) for i in range(len(v))], basis) for j in range(len(v))),
+                key=lambda u: _dot(u, u),
+            )
+            norm = math.sqrt(_dot(v, v))
+
+        basis.append([num / norm for num in v])
+
+    return basis
+
+
+def _orthogonalized_real(vector: Sequence[float], basis: Sequence[Sequence[float]]) -> list[float]:
+    v = list(vector)
+    for q in basis:
+        projection = _dot(q, v)
+        v = [a - projection * b for a, b in zip(v, q)]
+
+    return v
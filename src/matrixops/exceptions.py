@@ -4,3 +4,7 @@ class InconsistentOrder(Exception):
 
 class ZeroScalarMultiplication(Exception):
     """Raised when row is multiplied by 0 scalar."""
+
+
+class NoConvergence(Exception):
+    """Raised when an iterative method does not converge."""
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections.abc import MutableSequence, Sequence
+
+from matrixops.exceptions import InconsistentOrder, ZeroScalarMultiplication
+from matrixops.matrix import Matrix, MatrixOrder
+from matrixops.row import Row
+
+
+# a factor of a simplified expression: the source rows
+# and whether the factor is the transpose of that source
+Factor = tuple[Sequence[Sequence[int | float]], bool]
+
+
+class LazyMatrix(ABC):
+    """
+    Node of a lazily evaluated matrix expression.
+
+    Operations on a lazy matrix only build the expression graph,
+    nothing is computed until `evaluate` is called.
+    """
+
+    @property
+    @abstractmethod
+    def order(self) -> MatrixOrder:
+        ...
+
+    @property
+    def transpose(self) -> LazyMatrix:
+        return Transpose(self)
+
+    def dot_multiply(self, other: LazyMatrix | Matrix) -> LazyMatrix:
+        if isinstance(other, Matrix):
+            other = Leaf(other)
+        return Product(self, other)
+
+    def scalar_multiply(self, scalar: float) -> LazyMatrix:
+        return Scale(self, scalar)
+
+    @abstractmethod
+    def _flatten(self) -> tuple[float, list[tuple[Matrix, bool]]]:
+        """
+        Reduce the expression to `scalar * F1 * F2 * ... * Fn`, where
+        every factor is a source matrix or the transpose of one.
+
+        This is where the graph gets simplified: nested transposes
+        cancel out, scalars are folded into a single coefficient and
+        the transpose of a product is distributed over its factors
+        in reverse order.
+        """
+
+    def simplify(self) -> LazyMatrix:
+        scalar, factors = self._flatten()
+
+        nodes: list[LazyMatrix] = [
+            Transpose(Leaf(matrix)) if transposed else Leaf(matrix)
+            for matrix, transposed in factors
+        ]
+
+        node = nodes[0]
+        for factor in nodes[1:]:
+            node = Product(node, factor)
+
+        if scalar != 1:
+            node = Scale(node, scalar)
+
+        return node
+
+    def evaluate(self) -> Matrix:
+        scalar, factors = self._flatten()
+        operands: list[Factor] = [
+            ([row.nums for row in matrix.rows], transposed)
+            for matrix, transposed in factors
+        ]
+
+        # the scalar is applied only while forming the final product,
+        # intermediates of longer chains are kept as plain lists
+        result = operands[0]
+        for operand in operands[1:-1]:
+            result = (_multiply(result, operand, 1), False)
+
+        if len(operands) > 1:
+            grid = _multiply(result, operands[-1], scalar)
+        else:
+            grid = _scaled(result, scalar)
+
+        return Matrix(*[Row(*nums) for nums in grid])
+
+
+class Leaf(LazyMatrix):
+    def __init__(self, matrix: Matrix) -> None:
+        self.matrix = matrix
+
+    @property
+    def order(self) -> MatrixOrder:
+        return self.matrix.order
+
+    def _flatten(self) -> tuple[float, list[tuple[Matrix, bool]]]:
+        return 1, [(self.matrix, False)]
+
+    def __repr__(self) -> str:
+        return f"Leaf({self.matrix.order.rows}x{self.matrix.order.columns})"
+
+
+class Transpose(LazyMatrix):
+    def __init__(self, operand: LazyMatrix) -> None:
+        self.operand = operand
+
+    @property
+    def order(self) -> MatrixOrder:
+        order = self.operand.order
+        return MatrixOrder(rows=order.columns, columns=order.rows)
+
+    def _flatten(self) -> tuple[float, list[tuple[Matrix, bool]]]:
+        scalar, factors = self.operand._flatten()
+        # (AB)ᵀ = BᵀAᵀ and (Aᵀ)ᵀ = A
+        return scalar, [(matrix, not transposed) for matrix, transposed in reversed(factors)]
+
+    def __repr__(self) -> str:
+        return f"Transpose({self.operand!r})"
+
+
+class Product(LazyMatrix):
+    def __init__(self, left: LazyMatrix, right: LazyMatrix) -> None:
+        if left.order.columns != right.order.rows:
+            raise InconsistentOrder("Inconsistent order for dot multiplication.")
+
+        self.left = left
+        self.right = right
+
+    @property
+    def order(self) -> MatrixOrder:
+        return MatrixOrder(rows=self.left.order.rows, columns=self.right.order.columns)
+
+    def _flatten(self) -> tuple[float, list[tuple[Matrix, bool]]]:
+        left_scalar, left_factors = self.left._flatten()
+        right_scalar, right_factors = self.right._flatten()
+        return left_scalar * right_scalar, left_factors + right_factors
+
+    def __repr__(self) -> str:
+        return f"Product({self.left!r}, {self.right!r})"
+
+
+class Scale(LazyMatrix):
+    def __init__(self, operand: LazyMatrix, scalar: float) -> None:
+        # same as the eager Matrix.scalar_multiply
+        if scalar == 0:
+            raise ZeroScalarMultiplication("Cannot multiply by scalar 0.\n")
+
+        self.operand = operand
+        self.scalar = scalar
+
+    @property
+    def order(self) -> MatrixOrder:
+        return self.operand.order
+
+    def _flatten(self) -> tuple[float, list[tuple[Matrix, bool]]]:
+        scalar, factors = self.operand._flatten()
+        return scalar * self.scalar, factors
+
+    def __repr__(self) -> str:
+        return f"Scale({self.operand!r}, {self.scalar})"
+
+
+def _shape(operand: Factor) -> tuple[int, int]:
+    nums, transposed = operand
+    rows, columns = len(nums), len(nums[0])
+    return (columns, rows) if transposed else (rows, columns)
+
+
+def _row_of(operand: Factor, index: int) -> Sequence[int | float]:
+    nums, transposed = operand
+    if transposed:
+        # only this one row is gathered, the transpose
+        # itself is never materialized
+        return [row[index] for row in nums]
+    return nums[index]
+
+
+def _scaled(operand: Factor, scalar: float) -> MutableSequence[MutableSequence[int | float]]:
+    rows, _ = _shape(operand)
+    grid: MutableSequence[MutableSequence[int | float]] = []
+
+    for row_idx in range(rows):
+        row = _row_of(operand, row_idx)
+        grid.append([num * scalar for num in row] if scalar != 1 else list(row))
+
+    return grid
+
+
+def _multiply(left: Factor, right: Factor, scalar: float) -> MutableSequence[MutableSequence[int | float]]:
+    rows, _ = _shape(left)
+    _, columns = _shape(right)
+    right_nums, right_transposed = right
+
+    grid: MutableSequence[MutableSequence[int | float]] = []
+
+    for row_idx in range(rows):
+        left_row = _row_of(left, row_idx)
+        formed_row: MutableSequence[int | float]
+
+        if right_transposed:
+            # columns of the right operand are the rows of its source
+            formed_row = [
+                sum(a * b for a, b in zip(left_row, right_nums[col_idx]))
+                for col_idx in range(columns)
+            ]
+        else:
+            # accumulate scaled rows of the right operand, so that
+            # its columns never have to be gathered
+            formed_row = [0] * columns
+            for a, right_row in zip(left_row, right_nums):
+                if a == 0:
+                    continue
+                for col_idx in range(columns):
+                    formed_row[col_idx] += a * right_row[col_idx]
+
+        if scalar != 1:
+            formed_row = [num * scalar for num in formed_row]
+
+        grid.append(formed_row)
+
+    return grid
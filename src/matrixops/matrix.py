@@ -1,21 +1,37 @@
 from __future__ import annotations
 
 from collections.abc import MutableSequence, Sequence
-from copy import deepcopy
-from dataclasses import dataclass
 from enum import Enum
-from typing import Any, cast
+from typing import TYPE_CHECKING, Any, cast
 
 from matrixops.row import Row
-from matrixops.exceptions import InconsistentOrder
+from matrixops.exceptions import InconsistentOrder, ZeroScalarMultiplication
+from matrixops.numeric import DEFAULT_POLICY, NumericPolicy
 
-try:
-    get_ipython  # check if imported into ipython is running
-except NameError:
-    Math = None
-    display = None
-else:
-    from IPython.core.display import Math, display
+if TYPE_CHECKING:
+    from matrixops.eigen import EigenPair
+    from matrixops.lazy import LazyMatrix
+
+# IPython's (Math, display), looked up on first render, see _ipython_display
+_display: tuple[Any, Any] | None = None
+_display_resolved = False
+
+
+def _ipython_display() -> tuple[Any, Any] | None:
+    global _display, _display_resolved
+
+    if not _display_resolved:
+        try:
+            get_ipython  # check if imported into ipython is running
+        except NameError:
+            _display = None
+        else:
+            from IPython.core.display import Math, display
+            _display = (Math, display)
+
+        _display_resolved = True
+
+    return _display
 
 
 class BracketsType(Enum):
@@ -27,13 +43,25 @@ class BracketsType(Enum):
     DOUBLE_PIPES = "V"
     
 
-@dataclass
 class MatrixOrder:
-    rows: int
-    columns: int
+    __slots__ = ("rows", "columns")
+
+    def __init__(self, rows: int, columns: int) -> None:
+        self.rows = rows
+        self.columns = columns
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, MatrixOrder):
+            return NotImplemented
+        return self.rows == other.rows and self.columns == other.columns
+
+    def __repr__(self) -> str:
+        return f"MatrixOrder(rows={self.rows}, columns={self.columns})"
     
     
 class MatrixOperation:
+    __slots__ = ("message",)
+
     ADD_ROWS = "ADD_ROWS"
     INTERCHANGE = "INTERCHANGE"
     SCALAR_MULTIPLY = "SCALAR_MULTIPLY"
@@ -60,16 +88,32 @@ class MatrixOperation:
 
 
 class Matrix:
+    __slots__ = (
+        "__rows",
+        "brackets_type",
+        "print_notation",
+        "numeric_policy",
+        "__auto_print",
+        "__last_operation",
+        "__last_rows_state",
+        "__last_operation_state",
+    )
+
     def __init__(self, *rows: Row) -> None:
-        self.__rows: MutableSequence[Row] = []
+        self.__rows: MutableSequence[Row] = list(rows)
         self.brackets_type: BracketsType = BracketsType.SQUARE
         self.print_notation = True
-        self.auto_print = Math is not None  # of course this can be changed
+        self.numeric_policy: NumericPolicy = DEFAULT_POLICY
+        # None: decided on first use, by whether ipython is running
+        self.__auto_print: bool | None = None
         
         self.__last_operation: MatrixOperation | None = None
 
-        for row in rows:
-            self._add_row(row)
+        if rows:
+            columns = len(rows[0])
+            for row in rows:
+                if len(row) != columns:
+                    raise InconsistentOrder("Inconsistent number of columns.")
         
         # These two variables:
         # self.__last_rows_state
@@ -87,14 +131,21 @@ class Matrix:
         # self.__last_operation
         self.__last_rows_state: MutableSequence[Row] = self.__rows    
         self.__last_operation_state: MatrixOperation | None = None
-        
-    def __getattribute__(self, name: str) -> Any:
-        # instance methods that mutate the state of the matrix
-        if name in "add_rows interchange_rows scalar_multiply_row dot_multiply".split():
-            self.__last_rows_state = self.__rows
-            self.__last_operation_state = self.__last_operation
 
-        return object.__getattribute__(self, name)
+    def __save_state(self) -> None:
+        # called by instance methods that mutate the state of the matrix
+        self.__last_rows_state = self.__rows
+        self.__last_operation_state = self.__last_operation
+
+    @property
+    def auto_print(self) -> bool:
+        if self.__auto_print is None:
+            return _ipython_display() is not None
+        return self.__auto_print
+
+    @auto_print.setter
+    def auto_print(self, value: bool) -> None:
+        self.__auto_print = value
         
     @property
     def order(self) -> MatrixOrder:
@@ -114,7 +165,7 @@ class Matrix:
         for column in self.columns:
             new_rows.append(Row(*column))
             
-        return Matrix(*new_rows)
+        return self._derived(*new_rows)
     
     @property
     def inverse(self) -> Matrix | None:
@@ -123,12 +174,16 @@ class Matrix:
 
         determinant: float = cast(float, Matrix.calculate_determinant(self))
 
-        if determinant == 0:
+        # the size of the determinant grows with the size of the entries,
+        # so the tolerance is scaled to match: tolerance * max|a_ij| ** n
+        largest = max(abs(num) for row in self.__rows for num in row)
+        if abs(determinant) <= self.numeric_policy.tolerance * largest ** len(self.__rows):
             return None
 
         old_auto_print = self.auto_print
         self.auto_print = False
 
+        # the cofactor matrix and its transpose carry over this matrix's numeric policy
         adjoint: Matrix = cast(Matrix, Matrix.get_cofactor_matrix(self)).transpose
         adjoint.scalar_multiply(1 / determinant)
         
@@ -152,13 +207,19 @@ class Matrix:
             new_rows.append(Row(*new_row_interim))
             new_row_interim.clear()
             
-        new_matrix = Matrix(*new_rows)
+        new_matrix = self._derived(*new_rows)
 
         if self.auto_print:
             new_matrix._print_latex()
         
         return new_matrix
     
+    def _derived(self, *rows: Row) -> Matrix:
+        # matrices computed from this one are displayed like it
+        matrix = Matrix(*rows)
+        matrix.numeric_policy = self.numeric_policy
+        return matrix
+
     @property
     def rows(self) -> MutableSequence[Row]:
         return self.__rows
@@ -207,10 +268,19 @@ class Matrix:
         row1_idx -= 1
         row2_idx -= 1
         
-        self.__rows[row2_idx].mul_by_scalar(scalar)
-        self.__rows[row1_idx] += self.__rows[row2_idx]
-        # reverse the process of multiplication after addition
-        self.__rows[row2_idx].mul_by_scalar(1 / scalar)
+        if scalar == 0:
+            raise ZeroScalarMultiplication("Cannot multiply by scalar 0.\n")
+
+        # row2 is left untouched, so no multiplication
+        # has to be reversed after the addition
+        new_row = Row(*[
+            num1 + scalar * num2
+            for num1, num2 in zip(self.__rows[row1_idx], self.__rows[row2_idx])
+        ])
+
+        # the state is saved only once the operation is known to succeed
+        self.__save_state()
+        self.__rows[row1_idx] = new_row
         
         # for displaying
         row1_idx += 1
@@ -226,9 +296,12 @@ class Matrix:
         row1_idx -= 1
         row2_idx -= 1
         
-        temp = self.__rows[row1_idx]
-        self.__rows[row1_idx] = self.__rows[row2_idx]
-        self.__rows[row2_idx] = temp
+        row1 = self.__rows[row1_idx]
+        row2 = self.__rows[row2_idx]
+
+        self.__save_state()
+        self.__rows[row1_idx] = row2
+        self.__rows[row2_idx] = row1
         
         # for display
         row1_idx += 1
@@ -244,7 +317,13 @@ class Matrix:
             row.mul_by_scalar(scalar)
     
     def scalar_multiply_row(self, row_idx: int, scalar: float) -> None:
-        self.__rows[row_idx - 1].mul_by_scalar(scalar)
+        if scalar == 0:
+            raise ZeroScalarMultiplication("Cannot multiply by scalar 0.\n")
+
+        row = self.__rows[row_idx - 1]
+
+        self.__save_state()
+        row.mul_by_scalar(scalar)
 
         self.__last_operation = MatrixOperation(MatrixOperation.SCALAR_MULTIPLY, i=row_idx, k=scalar)
 
@@ -255,6 +334,8 @@ class Matrix:
         if self.order.columns != other.order.rows:
             raise InconsistentOrder("Inconsistent order for dot multiplication.")
 
+        self.__save_state()
+
         new_mat_rows: MutableSequence[Row] = []
         
         for row in self.rows:
@@ -279,7 +360,7 @@ class Matrix:
         row_to_del = row_pos - 1
         col_to_del = col_pos - 1
         
-        new_rows = cast(MutableSequence[MutableSequence[int | float]], [row.nums for row in deepcopy(matrix).rows])
+        new_rows = cast(MutableSequence[MutableSequence[int | float]], [list(row.nums) for row in matrix.rows])
         
         del new_rows[row_to_del]
         for row in new_rows:
@@ -312,6 +393,99 @@ class Matrix:
             
         return det
      
+    def eigenvalues(self, tolerance: float = 1e-12, max_iterations: int = 10_000) -> list[float | complex]:
+        """
+        Returns all eigenvalues, largest magnitude first, computed with
+        shifted QR iterations on the Hessenberg form of the matrix.
+        Eigenvalues whose imaginary part is within `tolerance` are
+        returned as floats.
+        """
+
+        if not self.is_square:
+            raise InconsistentOrder("Eigenvalues are only defined for square matrices.")
+
+        from matrixops import eigen
+
+        eigenvalues = eigen.qr_eigenvalues(self._nums(), tolerance, max_iterations)
+
+        return [self._real_if_close(value, tolerance) for value in sorted(eigenvalues, key=abs, reverse=True)]
+
+    def eigenvectors(
+        self, tolerance: float = 1e-12, max_iterations: int = 10_000
+    ) -> list[tuple[float | complex, list[float | complex]]]:
+        """
+        Returns (eigenvalue, unit eigenvector) pairs, ordered like `eigenvalues`.
+        A repeated eigenvalue gets orthogonal eigenvectors, unless the
+        matrix is defective and does not have that many.
+        """
+
+        if not self.is_square:
+            raise InconsistentOrder("Eigenvectors are only defined for square matrices.")
+
+        from matrixops import eigen
+
+        pairs = eigen.eigenpairs(self._nums(), tolerance, max_iterations)
+
+        return self._clean_eigenpairs(pairs, tolerance)
+
+    def dominant_eigen(
+        self, k: int = 1, tolerance: float = 1e-10, max_iterations: int = 1000
+    ) -> list[tuple[float | complex, list[float | complex]]]:
+        """
+        Returns the `k` (eigenvalue, unit eigenvector) pairs of largest
+        magnitude using power iteration. Much cheaper than `eigenvectors`
+        when only the top few pairs are needed.
+
+        Eigenvalues of equal magnitude (e.g. a complex conjugate pair) are
+        handled by iterating on a couple of extra vectors. If the iteration
+        still stalls within `max_iterations`, the result comes from the
+        full QR engine instead.
+        """
+
+        if not self.is_square:
+            raise InconsistentOrder("Eigenvectors are only defined for square matrices.")
+
+        from matrixops import eigen
+
+        pairs = eigen.dominant_eigenpairs(self.__rows, k, tolerance, max_iterations)
+
+        return self._clean_eigenpairs(pairs, tolerance)
+
+    def _nums(self) -> list[MutableSequence[int | float]]:
+        return [row.nums for row in self.__rows]
+
+    @staticmethod
+    def _real_if_close(num: complex, tolerance: float) -> float | complex:
+        if tolerance * max(1, abs(num)) >= abs(num.imag):
+            return num.real
+        return num
+
+    @staticmethod
+    def _clean_eigenpairs(
+        pairs: list[EigenPair], tolerance: float
+    ) -> list[tuple[float | complex, list[float | complex]]]:
+        cleaned: list[tuple[float | complex, list[float | complex]]] = []
+
+        for value, vector in sorted(pairs, key=lambda pair: abs(pair[0]), reverse=True):
+            value = Matrix._real_if_close(value, tolerance)
+            if isinstance(value, float):
+                cleaned.append((value, [Matrix._real_if_close(num, tolerance) for num in vector]))
+            else:
+                cleaned.append((value, list(vector)))
+
+        return cleaned
+
+    def lazy(self) -> LazyMatrix:
+        """
+        Returns a lazy view of this matrix. Operations on it build
+        an expression which is simplified and computed in one go
+        by `LazyMatrix.evaluate`.
+        """
+
+        from matrixops.lazy import Leaf
+
+        return Leaf(self)
+
     def transposify(self) -> None:
         self.transpose._print_latex()
             
@@ -333,7 +507,7 @@ class Matrix:
         rows_latex: list[str] = []
         
         for row in self.__rows:
-            rows_latex.append(row.as_latex())
+            rows_latex.append(row.as_latex(self.numeric_policy))
         
         # add double slash ("\\") at the end of each latex row
         # how it would appear: ...\\<newline>
@@ -345,7 +519,10 @@ class Matrix:
     
     def _print_latex(self) -> None:
         latex = self.as_latex()
-        if Math is not None:
+        ipython_display = _ipython_display()
+
+        if ipython_display is not None:
+            Math, display = ipython_display
             display(Math(latex))
         else:
             print(latex)
@@ -357,6 +534,23 @@ class Matrix:
         if self.auto_print:
             self._print_latex()
     
+    def is_close(self, other: Matrix, policy: NumericPolicy | None = None) -> bool:
+        """
+        Compares two matrices element-wise within the tolerance of `policy`,
+        this matrix's numeric policy by default. Unlike `==`, this is
+        suitable for results of floating point arithmetic.
+        """
+
+        if policy is None:
+            policy = self.numeric_policy
+
+        if len(self.__rows) != len(other.rows):
+            return False
+        return all(
+            policy.are_close(row.nums, other_row.nums)
+            for row, other_row in zip(self.__rows, other.rows)
+        )
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, Matrix):
             return NotImplemented
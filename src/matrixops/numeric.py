@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from enum import Enum
+from math import isclose, isfinite, isnan
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from fractions import Fraction
+
+
+class NumericMode(Enum):
+    EXACT = "exact"  # integral values as ints, others as fractions where one matches
+    FLOAT = "float"
+    DECIMAL = "decimal"  # rounded to a fixed number of decimal places
+
+
+class NumericPolicy:
+    """
+    Describes how numbers are presented and compared.
+
+    Arithmetic always runs on plain ints and floats, the policy
+    is applied only when a matrix is displayed or rendered to LaTeX,
+    and when values are tested against zero or compared for equality.
+
+    Policies are immutable, so one instance can be shared by many
+    matrices; create a new policy to change the settings.
+    """
+
+    __slots__ = ("mode", "precision", "tolerance")
+
+    mode: NumericMode
+    precision: int
+    tolerance: float
+
+    def __init__(
+        self,
+        mode: NumericMode = NumericMode.DECIMAL,
+        precision: int = 4,
+        tolerance: float = 1e-9,
+    ) -> None:
+        object.__setattr__(self, "mode", mode)
+        object.__setattr__(self, "precision", precision)
+        object.__setattr__(self, "tolerance", tolerance)
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"NumericPolicy is immutable, cannot set {name!r}.")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"NumericPolicy is immutable, cannot delete {name!r}.")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, NumericPolicy):
+            return NotImplemented
+        return (self.mode, self.precision, self.tolerance) == (other.mode, other.precision, other.tolerance)
+
+    def __hash__(self) -> int:
+        return hash((self.mode, self.precision, self.tolerance))
+
+    def __repr__(self) -> str:
+        return f"NumericPolicy(mode={self.mode}, precision={self.precision}, tolerance={self.tolerance})"
+
+    def is_zero(self, num: int | float) -> bool:
+        return abs(num) <= self.tolerance
+
+    def is_close(self, num1: int | float, num2: int | float) -> bool:
+        return isclose(num1, num2, rel_tol=self.tolerance, abs_tol=self.tolerance)
+
+    def are_close(self, nums1: Sequence[int | float], nums2: Sequence[int | float]) -> bool:
+        if len(nums1) != len(nums2):
+            return False
+        return all(self.is_close(a, b) for a, b in zip(nums1, nums2))
+
+    def normalize(self, num: int | float) -> int | float | Fraction:
+        if self.is_zero(num):
+            return 0
+
+        match self.mode:
+            case NumericMode.FLOAT:
+                return float(num)
+            case NumericMode.DECIMAL:
+                num = round(num, self.precision)
+            case NumericMode.EXACT:
+                if isinstance(num, int) or not isfinite(num):
+                    return num
+
+                nearest = round(num)
+                if abs(num - nearest) <= self.tolerance:
+                    return nearest
+
+                # imported here, only this mode needs it
+                from fractions import Fraction
+
+                # only fractions that actually match the value are used,
+                # anything else (like sqrt(2) or 1e-7) is kept as a float
+                fraction = Fraction(num).limit_denominator(_MAX_DENOMINATOR)
+                if abs(fraction - num) <= self.tolerance * max(1, abs(num)):
+                    return fraction
+
+                return num
+
+        # turn floats like 3.0 into ints
+        if isinstance(num, float) and num.is_integer():
+            return int(num)
+
+        return num
+
+    def as_latex(self, num: int | float) -> str:
+        if isinstance(num, float) and not isfinite(num):
+            if isnan(num):
+                return r"\text{NaN}"
+            return r"\infty" if num > 0 else r"-\infty"
+
+        normalized = self.normalize(num)
+
+        if self.mode is NumericMode.EXACT:
+            from fractions import Fraction
+
+            if isinstance(normalized, Fraction) and normalized.denominator != 1:
+                sign = "-" if normalized < 0 else ""
+                return fr"{sign}\frac{{{abs(normalized.numerator)}}}{{{normalized.denominator}}}"
+
+        return str(normalized)
+
+
+# exact mode does not render fractions with larger denominators
+_MAX_DENOMINATOR = 1000
+
+# used by matrices and rows unless told otherwise
+DEFAULT_POLICY = NumericPolicy()
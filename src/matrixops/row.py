@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Callable, MutableSequence, Iterator, Sequence
+from collections.abc import MutableSequence, Iterator, Sequence
 
 from matrixops.exceptions import ZeroScalarMultiplication
+from matrixops.numeric import DEFAULT_POLICY, NumericPolicy
 
 
 class Row:
+    __slots__ = ("__nums",)
+
     def __init__(self, *nums: int | float) -> None:
         self.__nums: MutableSequence[int | float] = list(nums)
         
@@ -26,22 +29,13 @@ class Row:
             raise ZeroScalarMultiplication("Cannot multiply by scalar 0.\n")
         if scalar == 1:
             return
-        
-        is_fractional_zero: Callable[[float | int], float] = lambda n: isinstance(n, float) and str(n).split(".")[1] == "0"
-
-        if is_fractional_zero(scalar):
-            scalar = int(scalar)
-
-        for index in range(len(self.__nums)):
-            product = round(self.__nums[index] * scalar, 1)
-
-            if is_fractional_zero(product):
-                product = int(product)
 
-            self.__nums[index] = product
+        # values are normalized by the numeric policy only
+        # when displayed, not on every arithmetic step
+        self.__nums[:] = [num * scalar for num in self.__nums]
         
-    def as_latex(self) -> str:
-        return " & ".join(map(str, self.__nums))
+    def as_latex(self, policy: NumericPolicy = DEFAULT_POLICY) -> str:
+        return " & ".join(map(policy.as_latex, self.__nums))
     
     def __add__(self, other: Row) -> Row:
         new_row: MutableSequence[int | float] = []
@@ -0,0 +1,147 @@
+import unittest
+
+from matrixops.eigen import hessenberg  # type: ignore
+from matrixops.exceptions import InconsistentOrder, NoConvergence
+from matrixops.matrix import Matrix  # type: ignore
+from matrixops.row import Row  # type: ignore
+
+
+class TestEigen(unittest.TestCase):
+    def setUp(self):
+        self.symmetric = Matrix(
+            Row(2, 0, 0),
+            Row(0, 3, 4),
+            Row(0, 4, 9),
+        )
+        self.general = Matrix(
+            Row(4, 1, 2, 3),
+            Row(1, 5, 7, 1),
+            Row(0, 2, 6, 8),
+            Row(3, 1, 1, 2),
+        )
+
+    def assertEigenPair(self, matrix, value, vector):
+        for row, num in zip(matrix.rows, vector):
+            self.assertAlmostEqual(abs(row.mul_by_col(vector) - value * num), 0, places=8)
+
+    def test_hessenberg(self):
+        h = hessenberg(self.general._nums())
+        for i in range(2, 4):
+            for j in range(i - 1):
+                self.assertEqual(h[i][j], 0)
+
+        # similarity transforms keep the trace
+        self.assertAlmostEqual(sum(h[i][i] for i in range(4)), 17)
+
+    def test_eigenvalues(self):
+        eigenvalues = self.symmetric.eigenvalues()
+        for value, expected in zip(eigenvalues, [11, 2, 1]):
+            self.assertIsInstance(value, float)
+            self.assertAlmostEqual(value, expected)
+
+        self.assertAlmostEqual(sum(self.general.eigenvalues()), 17)
+
+    def test_complex_eigenvalues(self):
+        rotation = Matrix(
+            Row(0, -1),
+            Row(1, 0),
+        )
+        eigenvalues = rotation.eigenvalues()
+        self.assertEqual(len(eigenvalues), 2)
+        for value in eigenvalues:
+            self.assertAlmostEqual(value.real, 0)
+            self.assertAlmostEqual(abs(value.imag), 1)
+
+    def test_eigenvalues_of_non_square_matrix(self):
+        self.assertRaises(InconsistentOrder, Matrix(Row(1, 2)).eigenvalues)
+
+    def test_eigenvectors(self):
+        for matrix in (self.symmetric, self.general):
+            pairs = matrix.eigenvectors()
+            self.assertEqual(len(pairs), len(matrix.rows))
+            for value, vector in pairs:
+                self.assertEigenPair(matrix, value, vector)
+
+    def test_repeated_eigenvalues(self):
+        identity = Matrix(
+            Row(1, 0, 0),
+            Row(0, 1, 0),
+            Row(0, 0, 1),
+        )
+        diagonal = Matrix(
+            Row(2, 0, 0),
+            Row(0, 2, 0),
+            Row(0, 0, 5),
+        )
+
+        for matrix in (identity, diagonal):
+            pairs = matrix.eigenvectors()
+            for value, vector in pairs:
+                self.assertEigenPair(matrix, value, vector)
+
+            # the eigenvectors span the whole space
+            vectors = Matrix(*[Row(*vector) for _, vector in pairs])
+            self.assertAlmostEqual(abs(Matrix.calculate_determinant(vectors)), 1)
+
+    def test_defective_matrix(self):
+        jordan = Matrix(
+            Row(1, 1),
+            Row(0, 1),
+        )
+        for value, vector in jordan.eigenvectors():
+            self.assertEigenPair(jordan, value, vector)
+
+    def test_dominant_eigen(self):
+        [(value, vector)] = self.symmetric.dominant_eigen()
+        self.assertAlmostEqual(value, 11)
+        self.assertEigenPair(self.symmetric, value, vector)
+
+        pairs = self.general.dominant_eigen(k=2)
+        expected = self.general.eigenvalues()[:2]
+        for (value, vector), expected_value in zip(pairs, expected):
+            self.assertAlmostEqual(abs(value - expected_value), 0, places=6)
+            self.assertEigenPair(self.general, value, vector)
+
+    def test_dominant_eigen_equal_magnitudes(self):
+        # the dominant eigenvalue is not unique in magnitude,
+        # plain power iteration would cycle on these
+        for matrix in (
+            Matrix(Row(3, 0), Row(0, -3)),
+            Matrix(Row(0, 1), Row(1, 0)),
+            Matrix(Row(0, -1, 0), Row(1, 0, 0), Row(0, 0, 0.5)),
+        ):
+            [(value, vector)] = matrix.dominant_eigen()
+            self.assertAlmostEqual(abs(value), abs(matrix.eigenvalues()[0]))
+            self.assertEigenPair(matrix, value, vector)
+
+        rotation = Matrix(Row(0, -1, 0), Row(1, 0, 0), Row(0, 0, 0.5))
+        values = sorted(value.imag for value, _ in rotation.dominant_eigen(k=2))
+        self.assertAlmostEqual(values[0], -1)
+        self.assertAlmostEqual(values[1], 1)
+
+    def test_dominant_eigen_fallback(self):
+        # a cyclic permutation: all five eigenvalues have magnitude 1, more
+        # than the extra vectors can absorb, so the power iteration stalls
+        # and the full QR engine is used instead
+        cycle = Matrix(
+            Row(0, 0, 0, 0, 1),
+            Row(1, 0, 0, 0, 0),
+            Row(0, 1, 0, 0, 0),
+            Row(0, 0, 1, 0, 0),
+            Row(0, 0, 0, 1, 0),
+        )
+        [(value, vector)] = cycle.dominant_eigen(max_iterations=50)
+        self.assertAlmostEqual(abs(value), 1)
+        self.assertEigenPair(cycle, value, vector)
+
+        self.assertRaises(ValueError, cycle.dominant_eigen, k=6)
+
+    def test_dominant_eigen_singular(self):
+        singular = Matrix(
+            Row(1, 0),
+            Row(0, 0),
+        )
+        pairs = singular.dominant_eigen(k=2)
+        for value, vector in pairs:
+            self.assertAlmostEqual(sum(abs(num) ** 2 for num in vector), 1)
+            self.assertEigenPair(singular, value, vector)
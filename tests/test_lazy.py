@@ -0,0 +1,131 @@
+import unittest
+
+from matrixops.exceptions import InconsistentOrder, ZeroScalarMultiplication
+from matrixops.lazy import LazyMatrix, Leaf, Product, Scale, Transpose  # type: ignore
+from matrixops.matrix import Matrix, MatrixOrder  # type: ignore
+from matrixops.row import Row  # type: ignore
+
+
+class TestLazyMatrix(unittest.TestCase):
+    def setUp(self):
+        self.matrix1 = Matrix(
+            Row(1, 2, 3),
+            Row(4, 5, 6),
+        )
+        self.matrix2 = Matrix(
+            Row(7, 8),
+            Row(9, 10),
+            Row(11, 12),
+        )
+
+    def test_order(self):
+        expr = self.matrix1.lazy().dot_multiply(self.matrix2).transpose
+        self.assertEqual(expr.order, MatrixOrder(rows=2, columns=2))
+
+    def test_inconsistent_order(self):
+        self.assertRaises(
+            InconsistentOrder,
+            self.matrix1.lazy().dot_multiply,
+            self.matrix1,
+        )
+
+    def test_zero_scalar(self):
+        self.assertRaises(
+            ZeroScalarMultiplication,
+            self.matrix1.lazy().scalar_multiply,
+            0,
+        )
+
+    def test_abstract_base(self):
+        self.assertRaises(TypeError, LazyMatrix)
+
+    def test_evaluate_leaf(self):
+        self.assertEqual(self.matrix1.lazy().evaluate(), self.matrix1)
+
+    def test_evaluate_transpose(self):
+        self.assertEqual(
+            self.matrix1.lazy().transpose.evaluate(),
+            self.matrix1.transpose,
+        )
+
+    def test_evaluate_dot_multiply(self):
+        self.assertEqual(
+            self.matrix1.lazy().dot_multiply(self.matrix2).evaluate(),
+            Matrix(
+                Row(58, 64),
+                Row(139, 154),
+            )
+        )
+
+    def test_evaluate_composite(self):
+        # (2 * (AB)ᵀ) evaluated without materializing any intermediate
+        expr = self.matrix1.lazy().dot_multiply(self.matrix2).transpose.scalar_multiply(2)
+        self.assertEqual(
+            expr.evaluate(),
+            Matrix(
+                Row(116, 278),
+                Row(128, 308),
+            )
+        )
+
+        # AᵀA touches the same source matrix twice
+        gram = self.matrix1.lazy().transpose.dot_multiply(self.matrix1)
+        self.assertEqual(
+            gram.evaluate(),
+            Matrix(
+                Row(17, 22, 27),
+                Row(22, 29, 36),
+                Row(27, 36, 45),
+            )
+        )
+
+    def test_evaluate_chain(self):
+        expr = (
+            self.matrix1.lazy()
+            .dot_multiply(self.matrix2)
+            .dot_multiply(self.matrix1)
+            .scalar_multiply(3)
+            .scalar_multiply(0.5)
+        )
+
+        expected = Matrix(*self.matrix1.rows)
+        expected.auto_print = False
+        expected.dot_multiply(self.matrix2)
+        expected.dot_multiply(self.matrix1)
+
+        self.assertEqual(
+            expr.evaluate(),
+            Matrix(*[Row(*[num * 1.5 for num in row]) for row in expected.rows]),
+        )
+
+    def test_evaluate_does_not_mutate_sources(self):
+        self.matrix1.lazy().transpose.scalar_multiply(4).evaluate()
+        self.assertEqual(
+            self.matrix1,
+            Matrix(
+                Row(1, 2, 3),
+                Row(4, 5, 6),
+            )
+        )
+
+    def test_simplify_double_transpose(self):
+        simplified = self.matrix1.lazy().transpose.transpose.simplify()
+        self.assertIsInstance(simplified, Leaf)
+
+    def test_simplify_scalar_folding(self):
+        simplified = self.matrix1.lazy().scalar_multiply(2).transpose.scalar_multiply(3).simplify()
+        self.assertIsInstance(simplified, Scale)
+        self.assertEqual(simplified.scalar, 6)
+        self.assertIsInstance(simplified.operand, Transpose)
+
+        identity = self.matrix1.lazy().scalar_multiply(2).scalar_multiply(0.5).simplify()
+        self.assertIsInstance(identity, Leaf)
+
+    def test_simplify_transposed_product(self):
+        # (AB)ᵀ = BᵀAᵀ
+        simplified = self.matrix1.lazy().dot_multiply(self.matrix2).transpose.simplify()
+        self.assertIsInstance(simplified, Product)
+        self.assertIsInstance(simplified.left, Transpose)
+        self.assertIs(simplified.left.operand.matrix, self.matrix2)
+        self.assertIsInstance(simplified.right, Transpose)
+        self.assertIs(simplified.right.operand.matrix, self.matrix1)
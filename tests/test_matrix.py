@@ -1,7 +1,8 @@
 import unittest
 
-from matrixops.exceptions import InconsistentOrder
+from matrixops.exceptions import InconsistentOrder, ZeroScalarMultiplication
 from matrixops.matrix import BracketsType, Matrix, MatrixOrder  # type: ignore
+from matrixops.numeric import NumericMode, NumericPolicy  # type: ignore
 from matrixops.row import Row  # type: ignore
 
 
@@ -45,15 +46,72 @@ class TestMatrix(unittest.TestCase):
             Row(2, 0, -2),
             Row(0, 1, 1),
         )
-        self.assertEqual(
-            mat2.inverse,
-            Matrix(
-                Row(0.2, 0.2, 0),
-                Row(-0.2, 0.3, 1),
-                Row(0.2, -0.3, 0),
+        # values are no longer rounded, so e.g. 3 * 0.1 is 0.30000000000000004
+        self.assertTrue(
+            mat2.inverse.is_close(
+                Matrix(
+                    Row(0.2, 0.2, 0),
+                    Row(-0.2, 0.3, 1),
+                    Row(0.2, -0.3, 0),
+                )
             )
         )
         
+    def test_inverse_of_small_entries(self):
+        small = Matrix(
+            Row(1e-4, 0, 0),
+            Row(0, 1e-4, 0),
+            Row(0, 0, 1e-4),
+        )
+        self.assertTrue(
+            small.inverse.is_close(
+                Matrix(
+                    Row(1e4, 0, 0),
+                    Row(0, 1e4, 0),
+                    Row(0, 0, 1e4),
+                )
+            )
+        )
+
+        singular = Matrix(
+            Row(1e-4, 2e-4),
+            Row(2e-4, 4e-4),
+        )
+        self.assertIsNone(singular.inverse)
+
+    def test_eq(self):
+        self.assertNotEqual(Matrix(Row(0.1 * 3, 1)), Matrix(Row(0.3, 1)))
+        self.assertNotEqual(Matrix(Row(1e-10)), Matrix(Row(0)))
+
+    def test_is_close(self):
+        self.assertTrue(Matrix(Row(0.1 * 3, 1)).is_close(Matrix(Row(0.3, 1))))
+        self.assertFalse(Matrix(Row(1, 2)).is_close(Matrix(Row(1, 2), Row(3, 4))))
+
+        # the tolerance comes from this matrix's policy, or the one passed in
+        strict = Matrix(Row(1e-10))
+        strict.numeric_policy = NumericPolicy(tolerance=1e-12)
+        self.assertFalse(strict.is_close(Matrix(Row(0))))
+        self.assertTrue(strict.is_close(Matrix(Row(0)), NumericPolicy()))
+
+    def test_numeric_policy_is_per_matrix(self):
+        other = Matrix(Row(1, 2))
+        self.matrix1.numeric_policy = NumericPolicy(mode=NumericMode.EXACT)
+        self.assertEqual(other.numeric_policy.mode, NumericMode.DECIMAL)
+
+    def test_derived_matrices_keep_numeric_policy(self):
+        policy = NumericPolicy(mode=NumericMode.EXACT)
+        mat2 = Matrix(
+            Row(3, 0, 2),
+            Row(2, 0, -2),
+            Row(0, 1, 1),
+        )
+        mat2.numeric_policy = policy
+
+        self.assertIs(mat2.transpose.numeric_policy, policy)
+        self.assertIs(mat2.get_cofactor_matrix().numeric_policy, policy)
+        self.assertIs(mat2.inverse.numeric_policy, policy)
+        self.assertIn(r"\frac{1}{5}", mat2.inverse.as_latex())
+
     def test_transpose_property(self):
         self.assertEqual(
             self.matrix1.transpose,
@@ -209,6 +267,39 @@ class TestMatrix(unittest.TestCase):
         
         self.assertRaises(InconsistentOrder, mat3.dot_multiply, mat4)
         
+    def test_rejected_operation_keeps_undo_state(self):
+        self.matrix1.auto_print = False
+        self.matrix1.dot_multiply(self.matrix1)
+        multiplied = Matrix(*self.matrix1.rows)
+
+        self.assertRaises(ZeroScalarMultiplication, self.matrix1.add_rows, 1, 2, 0)
+        self.assertRaises(ZeroScalarMultiplication, self.matrix1.scalar_multiply_row, 1, 0)
+        self.assertRaises(InconsistentOrder, self.matrix1.dot_multiply, Matrix(Row(1, 2)))
+        self.assertRaises(IndexError, self.matrix1.interchange_rows, 1, 9)
+
+        # undo still reverts the last successful operation
+        self.assertEqual(self.matrix1, multiplied)
+        self.matrix1.undo()
+        self.assertEqual(
+            self.matrix1,
+            Matrix(
+                Row(1, 2, 3),
+                Row(7, 8, 9),
+                Row(3, 5, 7),
+            )
+        )
+
+    def test_auto_print(self):
+        # outside of ipython nothing is displayed unless asked for
+        self.assertFalse(self.matrix1.auto_print)
+
+        self.matrix1.auto_print = True
+        self.assertTrue(self.matrix1.auto_print)
+
+    def test_slots(self):
+        for obj in (self.matrix1, self.matrix1.rows[0], self.matrix1.order):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
     # test for private method: Matrix._add_row
     def test__add_row(self):
         self.matrix1._add_row( # type: ignore
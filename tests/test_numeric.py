@@ -0,0 +1,68 @@
+import unittest
+from fractions import Fraction
+
+from matrixops.numeric import NumericMode, NumericPolicy  # type: ignore
+
+
+class TestNumericPolicy(unittest.TestCase):
+    def setUp(self):
+        self.policy = NumericPolicy()
+
+    def test_is_zero(self):
+        self.assertTrue(self.policy.is_zero(0))
+        self.assertTrue(self.policy.is_zero(-1e-12))
+        self.assertFalse(self.policy.is_zero(0.01))
+
+    def test_is_close(self):
+        self.assertTrue(self.policy.is_close(0.1 * 3, 0.3))
+        self.assertFalse(self.policy.is_close(0.3, 0.31))
+        self.assertTrue(self.policy.are_close([0.1 * 3, 2], [0.3, 2.0]))
+        self.assertFalse(self.policy.are_close([1, 2], [1, 2, 3]))
+
+    def test_normalize_decimal(self):
+        self.assertEqual(self.policy.normalize(3.0), 3)
+        self.assertIsInstance(self.policy.normalize(3.0), int)
+        self.assertEqual(self.policy.normalize(0.1 * 3), 0.3)
+        self.assertEqual(self.policy.normalize(0.01), 0.01)
+        self.assertEqual(self.policy.normalize(-1e-12), 0)
+
+        self.assertEqual(NumericPolicy(precision=1).normalize(2.46), 2.5)
+
+    def test_normalize_float(self):
+        policy = NumericPolicy(mode=NumericMode.FLOAT)
+        self.assertIsInstance(policy.normalize(3), float)
+        self.assertEqual(policy.normalize(0.1 * 3), 0.1 * 3)
+
+    def test_normalize_exact(self):
+        policy = NumericPolicy(mode=NumericMode.EXACT)
+        self.assertEqual(policy.normalize(5), 5)
+        self.assertEqual(policy.normalize(3.0000000000001), 3)
+        self.assertEqual(policy.normalize(1 / 3), Fraction(1, 3))
+        self.assertEqual(policy.normalize(0.1 * 3), Fraction(3, 10))
+
+        # values without a matching fraction are kept as they are
+        self.assertEqual(policy.normalize(1e-7), 1e-7)
+        self.assertEqual(policy.normalize(2 ** 0.5), 2 ** 0.5)
+        self.assertEqual(policy.normalize(float("inf")), float("inf"))
+
+    def test_as_latex(self):
+        self.assertEqual(self.policy.as_latex(6.0), "6")
+        self.assertEqual(self.policy.as_latex(0.1 * 3), "0.3")
+
+        policy = NumericPolicy(mode=NumericMode.EXACT)
+        self.assertEqual(policy.as_latex(-2 / 3), r"-\frac{2}{3}")
+        self.assertEqual(policy.as_latex(0.5), r"\frac{1}{2}")
+        self.assertEqual(policy.as_latex(1e-7), "1e-07")
+
+    def test_as_latex_non_finite(self):
+        for policy in (self.policy, NumericPolicy(mode=NumericMode.EXACT)):
+            self.assertEqual(policy.as_latex(float("inf")), r"\infty")
+            self.assertEqual(policy.as_latex(float("-inf")), r"-\infty")
+            self.assertEqual(policy.as_latex(float("nan")), r"\text{NaN}")
+
+    def test_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.policy.mode = NumericMode.EXACT  # type: ignore
+
+        self.assertEqual(self.policy, NumericPolicy())
+        self.assertEqual(hash(self.policy), hash(NumericPolicy()))
@@ -24,6 +24,15 @@ class TestRow(unittest.TestCase):
         self.assertEqual(self.row1.nums, [5, 10, 15])
 
         self.assertRaises(Exception, self.row1.mul_by_scalar, scalar=0)
+
+        # small values are not rounded away
+        self.row2.mul_by_scalar(scalar=0.01)
+        self.assertEqual(self.row2.nums, [0.04, 0.05, 0.06])
+        self.assertNotEqual(self.row2, Row(0, 0.1, 0.1))
+
+    def test_as_latex(self):
+        self.row1.mul_by_scalar(scalar=1.5)
+        self.assertEqual(self.row1.as_latex(), "1.5 & 3 & 4.5")
       
     # operator tests  
     def test_add(self):
@@ -34,4 +43,7 @@ class TestRow(unittest.TestCase):
         self.assertEqual(self.row1.nums, [1,2,3])
         
         self.assertFalse(self.row1 == self.row2)
+
+        # rows are compared exactly, unlike matrices
+        self.assertNotEqual(Row(1e-10), Row(0))
  
\ No newline at end of file